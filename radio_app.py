@@ -5,6 +5,7 @@
 import sys
 import os
 import threading
+from itertools import islice
 import streamlit as st
 from pathlib import Path
 import pandas as pd
@@ -19,7 +20,7 @@ DJ_DIR = Path(__file__).parent
 sys.path.append(str(DJ_DIR))
 
 try:
-    from random_radio_ollama import RandomRadio, discover_albums
+    from random_radio_ollama import RandomRadio, load_albums
 except Exception as exc:
     st.error(f"Could not import DJ code: {exc}")
     sys.exit(1)
@@ -27,50 +28,120 @@ except Exception as exc:
 # ------------------------------------------------------------------
 #  Streamlit helpers
 # ------------------------------------------------------------------
+@st.cache_resource
+def _registry() -> tuple:
+    """
+    Process‑wide (lock, {config: RandomRadio}) shared by every browser
+    session – one live radio (VLC player + DJ thread) per config.
+    """
+    return threading.Lock(), {}
+
+
+def get_radio(config: tuple, rescan: bool = False) -> RandomRadio:
+    """
+    Return the shared radio for *config*, building and starting it if there
+    is none yet (or the previous one was stopped).  *config* is the hashable
+    tuple (root_path, csv_path, fx_dir, duck, music).  *rescan* only affects
+    how a new radio scans the library, so it is not part of the key.
+    """
+    lock, radios = _registry()
+    with lock:
+        radio = radios.get(config)
+        if radio is not None and not radio.stopped:
+            return radio
+
+    # Scan without the lock – a slow (NAS) library must not block Stop or
+    # other tabs' Start; two racing Starts may both scan, only one radio wins
+    root_path, csv_path, fx_dir, duck, music = config
+    albums = load_albums(Path(root_path).expanduser(), rescan=rescan)
+    if not albums:
+        raise ValueError("No audio files found in the selected root.")
+
+    with lock:
+        radio = radios.get(config)
+        if radio is not None and not radio.stopped:
+            return radio  # another session started it while we scanned
+
+        radio = RandomRadio(
+            albums=albums,
+            export_csv=Path(csv_path) if csv_path else None,
+            fx_dir=Path(fx_dir) if fx_dir else None,
+            duck_to=duck,
+            music_vol=music,
+        )
+        threading.Thread(target=radio.start, daemon=True).start()
+        radios[config] = radio
+        return radio
+
+
+def _evict_radio(radio: RandomRadio):
+    """Drop *radio* from the registry – other configs' radios are untouched."""
+    lock, radios = _registry()
+    with lock:
+        for config, cached in list(radios.items()):
+            if cached is radio:
+                del radios[config]
+
+
 def _ensure_radio():
-    """Lazy‑create a Radio instance in session_state if it does not exist."""
+    """
+    Make sure session_state has a ``radio`` slot, and forget a radio that
+    was stopped (possibly from another session).
+    """
     if "radio" not in st.session_state:
         st.session_state.radio = None
-    if "thread" not in st.session_state:
-        st.session_state.thread = None
+    elif st.session_state.radio is not None and st.session_state.radio.stopped:
+        st.session_state.radio = None
 
 
 def _start_radio():
-    """Start the DJ in a background thread."""
+    """Attach this session to the shared DJ (starting it if needed)."""
     _ensure_radio()
     if st.session_state.radio is None:
         root = Path(st.session_state.root_path).expanduser()
         if not root.exists():
             st.error(f"Root directory does not exist: {root}")
             return
-        albums = discover_albums(root)
-        if not albums:
-            st.warning("No audio files found in the selected root.")
-            return
-
-        st.session_state.radio = RandomRadio(
-            albums=albums,
-            export_csv=Path(st.session_state.csv_path) if st.session_state.csv_path else None,
-            fx_dir=Path(st.session_state.fx_dir) if st.session_state.fx_dir else None,
-            duck_to=st.session_state.duck,
-            music_vol=st.session_state.music,
-        )
-        st.session_state.thread = threading.Thread(
-            target=st.session_state.radio.start, daemon=True
+        config = (
+            st.session_state.root_path,
+            st.session_state.csv_path,
+            st.session_state.fx_dir,
+            st.session_state.duck,
+            st.session_state.music,
         )
-        st.session_state.thread.start()
+        try:
+            with st.spinner("Scanning music library…"):
+                st.session_state.radio = get_radio(
+                    config, rescan=st.session_state.rescan
+                )
+        except ValueError as exc:
+            st.warning(str(exc))
+            return
         st.success("Radio started – you should now hear music on your speakers!")
 
 
 def _stop_radio():
-    """Stop the DJ."""
-    if st.session_state.radio:
-        st.session_state.radio.player.stop()
+    """Stop the DJ (for every session sharing it)."""
+    _ensure_radio()
+    radio = st.session_state.radio
+    if radio:
+        radio.stop()
+        _evict_radio(radio)
         st.session_state.radio = None
-        st.session_state.thread = None
         st.success("Radio stopped.")
 
 
+def _set_duck(radio: RandomRadio):
+    """Slider callback – apply this session's new duck volume."""
+    radio.duck_to = st.session_state.duck_slider
+
+
+def _set_music(radio: RandomRadio):
+    """Slider callback – apply this session's new music volume right away."""
+    radio.music_vol = st.session_state.music_slider
+    radio.player.audio_set_volume(radio.music_vol)
+
+
 # ------------------------------------------------------------------
 #  Streamlit layout
 # ------------------------------------------------------------------
@@ -114,6 +185,13 @@ def main():
             value=80,
             key="music",
         )
+        st.checkbox(
+            "Rescan library on start",
+            value=False,
+            key="rescan",
+            help="Ignore the cached library scan – needed after changes deeper "
+            "than a top-level folder (e.g. Artist/Album/new.mp3)",
+        )
         st.markdown("---")
         if st.button("Start Radio"):
             _start_radio()
@@ -121,7 +199,8 @@ def main():
             _stop_radio()
 
     # ---------- Main panel ----------
-    if st.session_state.get("radio") is None:
+    _ensure_radio()
+    if st.session_state.radio is None:
         st.info("Please press **Start Radio** in the sidebar to begin.")
         return
 
@@ -129,9 +208,9 @@ def main():
 
     # ---- Current track information ----
     st.subheader("Now Playing")
-    album, track_path = radio.current_track()
-    st.write(f"**Album:** {album}")
-    st.write(f"**Track:** {track_path.name}")
+    info = radio.current_track_info()
+    st.write(f"**Album:** {info['album']}")
+    st.write(f"**Track:** {info['track']}")
 
     # ---- Commentary display ----
     if radio.history:
@@ -145,8 +224,7 @@ def main():
 
     with col1:
         if st.button("⏮️ Previous", key="prev_btn"):
-            radio.idx = (radio.idx - 1) % len(radio.queue)
-            radio._play_current()
+            radio.skip(-1)
 
     with col2:
         if st.button("⏸️ Pause/Play", key="pause_btn"):
@@ -157,42 +235,44 @@ def main():
 
     with col3:
         if st.button("⏭️ Next", key="next_btn"):
-            radio.idx = (radio.idx + 1) % len(radio.queue)
-            radio._play_current()
+            radio.skip(1)
 
     # ---- Volume sliders (live) ----
     st.markdown("---")
     col4, col5 = st.columns(2)
 
+    # Only a slider the user actually moved writes to the shared radio –
+    # a plain rerun must not push this tab's stale value over another's
     with col4:
-        duck = st.slider(
+        st.slider(
             "Duck Volume",
             min_value=0,
             max_value=100,
             value=radio.duck_to,
             key="duck_slider",
-            on_change=lambda d=radio.duck_to: setattr(radio, "duck_to", d),
+            on_change=_set_duck,
+            args=(radio,),
         )
-        radio.duck_to = duck
 
     with col5:
-        music = st.slider(
+        st.slider(
             "Music Volume",
             min_value=0,
             max_value=100,
             value=radio.music_vol,
             key="music_slider",
-            on_change=lambda m=radio.music_vol: radio.player.audio_set_volume(m),
+            on_change=_set_music,
+            args=(radio,),
         )
-        radio.music_vol = music
 
     # ---- Recent history table ----
     st.markdown("---")
     st.subheader("Recent Tracks / Commentaries")
     if radio.history:
-        df = pd.DataFrame(radio.history)
-        # Show only the 10 most recent rows
-        st.dataframe(df.tail(10).reset_index(drop=True))
+        # Build the frame from the 10 most recent rows only
+        start = max(0, len(radio.history) - 10)
+        df = pd.DataFrame(list(islice(radio.history, start, None)))
+        st.dataframe(df, hide_index=True)
     else:
         st.write("No history yet – you’re listening to the first track.")
 
@@ -7,16 +7,22 @@ Random Radio – Portable DJ powered by VLC, Ollama & (optional) Pillow.
 # Imports
 # ----------------------------------------------------------------------
 import argparse
+import atexit
 import csv
+import hashlib
 import pathlib
+import pickle
 import random
+import sqlite3
 import threading
 import time
 import sys
 import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import vlc
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
 
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -32,18 +38,43 @@ except Exception:
 # Constants
 # ----------------------------------------------------------------------
 DEFAULT_MODEL = "gemma3:4b"
+OLLAMA_KEEP_ALIVE = "1h"  # keep the model loaded between tracks
 DEFAULT_DUCK_TO = 20      # % volume when DJ speaks
 DEFAULT_MUSIC_VOL = 80    # % volume when music plays
+HISTORY_LEN = 500         # plays kept in memory (the CSV keeps everything)
+CSV_FLUSH_EVERY = 8       # CSV rows buffered before an explicit flush
+WATCHDOG_SECS = 30        # max idle wait of the DJ loop between VLC events
+PREFETCH_WAIT_SECS = 15   # max wait on a prefetched commentary before streaming
 SUPPORTED_EXT = (".mp3", ".wav", ".ogg", ".flac", ".aac")
+DISCOVER_WORKERS = 8      # parallel directory scans in discover_albums()
+DEFAULT_CACHE_DB = pathlib.Path.home() / ".cache" / "random_radio" / "commentary.sqlite"
+DEFAULT_LIBRARY_CACHE = pathlib.Path.home() / ".cache" / "random_radio" / "library.pkl"
 
 # ----------------------------------------------------------------------
 # Utility – flatten the album map into a shuffled queue
 # ----------------------------------------------------------------------
-def build_queue(albums: Dict[str, List[pathlib.Path]]) -> List[tuple]:
-    """Return a shuffled list of (album, track_path) tuples."""
-    queue = [(album, track) for album, tracks in albums.items() for track in tracks]
-    random.shuffle(queue)
-    return queue
+def build_queue(
+    albums: Dict[str, List[pathlib.Path]],
+    rng: Optional[random.Random] = None,
+) -> Tuple[List[str], List[pathlib.Path], List[str], List[str]]:
+    """
+    Return four parallel, shuffled lists: album names, track paths, track
+    file names and track paths as str (what VLC wants).
+    """
+    # Flatten straight into parallel lists – no per-track (album, path) tuple.
+    # Album names repeat for every track – intern them so they share one str
+    flat_a = [sys.intern(a) for a, ts in albums.items() for _ in ts]
+    flat_t = [t for ts in albums.values() for t in ts]
+    # One sample() call builds the permuted index list directly
+    order = (rng or random).sample(range(len(flat_t)), len(flat_t))
+    # map(list.__getitem__) reorders in C rather than a bytecode loop
+    tracks = list(map(flat_t.__getitem__, order))
+    return (
+        list(map(flat_a.__getitem__, order)),
+        tracks,
+        [t.name for t in tracks],
+        [str(t) for t in tracks],
+    )
 
 
 # ----------------------------------------------------------------------
@@ -51,18 +82,17 @@ def build_queue(albums: Dict[str, List[pathlib.Path]]) -> List[tuple]:
 # ----------------------------------------------------------------------
 class TTS:
     def __init__(self):
-        self.font = None
-        if Image is None:
-            return
-        try:
-            self.font = ImageFont.load_default()
-        except Exception:
-            pass
+        self.font = None  # loaded on first render()
 
     def render(self, text: str, output: pathlib.Path) -> pathlib.Path:
         """Render a tiny PNG that contains *text* – useful only in debug mode."""
         if Image is None:
             return output
+        if self.font is None:
+            try:
+                self.font = ImageFont.load_default()
+            except Exception:
+                pass
         img = Image.new("RGB", (400, 200), "black")
         d = ImageDraw.Draw(img)
         d.text((10, 10), text, font=self.font, fill=(255, 255, 255))
@@ -88,6 +118,8 @@ class RandomRadio:
         fx_dir: Optional[pathlib.Path] = None,
         duck_to: int = DEFAULT_DUCK_TO,
         music_vol: int = DEFAULT_MUSIC_VOL,
+        cache_db: Optional[pathlib.Path] = DEFAULT_CACHE_DB,
+        debug: bool = False,
     ):
         # ------------------------------------------------------------------
         # Album / FX / CSV / config
@@ -98,14 +130,68 @@ class RandomRadio:
         self.music_vol = music_vol
         self.export_csv = export_csv
         self.model = model
+        self.debug = debug
+
+        # ------------------------------------------------------------------
+        # CSV – one buffered handle + writer for the whole session
+        # ------------------------------------------------------------------
+        self._csv_fp = None
+        self._csv_writer = None
+        self._csv_pending = 0
+        self._csv_lock = threading.Lock()  # DJ thread writes, stop() closes
+        if export_csv:
+            self._csv_fp = export_csv.open(
+                "a", buffering=1 << 16, encoding="utf-8", newline=""
+            )
+            self._csv_writer = csv.DictWriter(
+                self._csv_fp, fieldnames=["timestamp", "album", "track", "commentary"]
+            )
+            if self._csv_fp.tell() == 0:
+                self._csv_writer.writeheader()
+            atexit.register(self._csv_fp.close)
+
+        # ------------------------------------------------------------------
+        # Commentary cache – SQLite, shared by the VLC and UI threads
+        # ------------------------------------------------------------------
+        self._db = None
+        self._db_lock = threading.Lock()
+        if cache_db:
+            cache_db.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(cache_db), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            # WAL + NORMAL: commits append to the log, fsync only at checkpoints
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            # key = blake2b(model + prompt): a new prompt template misses cleanly
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS commentary"
+                " (key TEXT PRIMARY KEY, response TEXT, created_at REAL)"
+            )
+            self._db.commit()
+            atexit.register(self._db.close)
 
         # ------------------------------------------------------------------
         # VLC – a *plain* MediaPlayer – no Instance() needed (works everywhere)
         # ------------------------------------------------------------------
         self.player = vlc.MediaPlayer()
-        self.player.event_manager().event_attach(
-            vlc.EventType.MediaPlayerEndReached, self._on_track_end
+        events = self.player.event_manager()
+        events.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_track_end)
+        events.event_attach(
+            vlc.EventType.MediaPlayerEncounteredError, self._on_track_error
         )
+        # One long-lived player for FX; FX files indexed by name once
+        self._fx_player = vlc.MediaPlayer()
+        self._fx_map: Dict[str, str] = {}
+        if self.fx_dir:
+            rank = {ext: i for i, ext in enumerate(SUPPORTED_EXT)}
+            files = []
+            with os.scandir(self.fx_dir) as it:
+                for entry in it:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext.lower() in rank and entry.is_file():
+                        files.append((rank[ext.lower()], stem, entry.path))
+            # Same stem, several formats → the earliest SUPPORTED_EXT wins
+            files.sort(reverse=True)
+            self._fx_map = {stem.lower(): path for _, stem, path in files}
 
         # ------------------------------------------------------------------
         # TTS – Pillow debugging only
@@ -115,19 +201,42 @@ class RandomRadio:
         # ------------------------------------------------------------------
         # State
         # ------------------------------------------------------------------
-        self.queue = build_queue(albums)
+        self._rng = random.Random()
+        (
+            self.albums_arr,
+            self.tracks_arr,
+            self.track_names,
+            self.track_strs,
+        ) = build_queue(albums, self._rng)
         self.idx = 0
-        self.lock = threading.Lock()
+        # Rebuilt once per play; current_track_info() hands it out as-is
+        self._current_info: Dict[str, str] = {
+            "album": self.albums_arr[0],
+            "track": self.track_names[0],
+        }
         self.mood_hint = None
-        self.history: List[Dict] = []
+        self.history: Deque[Dict] = deque(maxlen=HISTORY_LEN)
+        self._wake = threading.Event()  # set by VLC callbacks, awaited by start()
+        self._stopped = threading.Event()  # set once by stop() – never cleared
+        self._steps = 0  # pending moves through the queue, applied by start()
+        self._steps_lock = threading.Lock()
+
+        # ------------------------------------------------------------------
+        # Prefetch – next track's commentary is generated during this one
+        # ------------------------------------------------------------------
+        self._exec = ThreadPoolExecutor(max_workers=2)
+        self._pending: Dict[int, "Future[str]"] = {}
 
     # ------------------------------------------------------------------
-    # VLC event callback – advance queue on track finish
+    # VLC event callbacks – advance queue on track finish, wake on error
     # ------------------------------------------------------------------
     def _on_track_end(self, event):
-        with self.lock:
-            self.idx = (self.idx + 1) % len(self.queue)
-        self._play_current()
+        # Runs on libvlc's event thread: never call back into libvlc (or
+        # Ollama) here – just request the move and let the start() loop play it.
+        self._request_step(1)
+
+    def _on_track_error(self, event):
+        self._wake.set()
 
     # ------------------------------------------------------------------
     # Public API – kick the DJ loop
@@ -135,23 +244,79 @@ class RandomRadio:
     def start(self):
         self._play_current()
         try:
-            while True:
-                time.sleep(0.5)
+            while not self._stopped.is_set():
+                # Sleep until VLC reports something (or the watchdog timeout)
+                woke = self._wake.wait(timeout=WATCHDOG_SECS)
+                self._wake.clear()
+                if self._stopped.is_set():
+                    return
+                with self._steps_lock:
+                    steps, self._steps = self._steps, 0
+                if self.player.get_state() == vlc.State.Error:
+                    steps += 1  # unplayable file – skip it rather than go silent
+                elif not woke and not steps:
+                    continue
+                # The only writer of idx – callbacks and skip() go via _steps
+                self.idx = (self.idx + steps) % len(self.tracks_arr)
+                self._play_current()
         except KeyboardInterrupt:
             print("\n🛑 Stopping…")
-            self.player.stop()
+            self.stop()
             sys.exit(0)
 
+    @property
+    def stopped(self) -> bool:
+        """True once stop() was called – a stopped radio cannot be restarted."""
+        return self._stopped.is_set()
+
+    def stop(self):
+        """Stop playback and the DJ loop, drop prefetches, close the CSV and cache."""
+        self._stopped.set()
+        self._wake.set()  # let start() see the flag and return
+        self.player.stop()
+        self._fx_player.stop()
+        self._exec.shutdown(wait=False, cancel_futures=True)
+        with self._csv_lock:
+            if self._csv_writer is not None:
+                atexit.unregister(self._csv_fp.close)
+                self._csv_writer = None
+                self._csv_fp.close()
+        with self._db_lock:
+            if self._db is not None:
+                atexit.unregister(self._db.close)
+                self._db.close()
+                self._db = None
+
+    def skip(self, step: int = 1):
+        """
+        Move *step* tracks through the queue (negative = back).  Returns at
+        once – the start() loop does the actual playback and commentary.
+        """
+        if self._stopped.is_set():
+            return
+        self._request_step(step)
+
     # ------------------------------------------------------------------
     # Internal helpers – no self.vlc_inst references
     # ------------------------------------------------------------------
+    def _request_step(self, step: int):
+        """Queue a move of *step* tracks for start() and wake it up."""
+        with self._steps_lock:
+            self._steps += step
+        self._wake.set()
+
     def _play_current(self):
-        album, track = self.queue[self.idx]
+        if self._stopped.is_set():
+            return
+        idx = self.idx
+        album = self.albums_arr[idx]
+        track_name = self.track_names[idx]
+        self._current_info = {"album": album, "track": track_name}
         # Stop any previous playback
         self.player.stop()
 
         # Create a Media object for the track
-        media = vlc.Media(str(track))
+        media = vlc.Media(self.track_strs[idx])
         self.player.set_media(media)
 
         # Normal music volume
@@ -159,100 +324,270 @@ class RandomRadio:
         self.player.play()
 
         # Generate commentary (ducks, FX, Ollama)
-        commentary = self._host_commentary(album, track.name)
-
-        # Persist history / optional CSV
-        self.history.append(
-            {
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "album": album,
-                "track": track.name,
-                "commentary": commentary,
-            }
-        )
-        if self.export_csv:
-            self._write_csv(commentary)
-
-    def _host_commentary(self, album: str, track_name: str) -> str:
-        """Duck, play FX, call Ollama, restore volume."""
-        # 1️⃣ Duck
+        commentary = self._host_commentary(idx, album, track_name)
+        if self._stopped.is_set():
+            return  # stop() ran meanwhile – CSV is closed, nothing to log to
+
+        # This track's request is done – now overlap the next track's LLM
+        # round-trip with this track's music (no competing for Ollama)
+        nxt = (idx + 1) % len(self.tracks_arr)
+        if nxt not in self._pending:
+            try:
+                self._pending[nxt] = self._exec.submit(
+                    self._query_ollama, self.albums_arr[nxt], self.track_names[nxt]
+                )
+            except RuntimeError:
+                pass  # stop() shut the executor down meanwhile
+
+        # Persist history / optional CSV – one timestamp, one row dict for both
+        row = {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "album": album,
+            "track": track_name,
+            "commentary": commentary,
+        }
+        self.history.append(row)
+        self._write_csv(row)
+
+    def _host_commentary(self, idx: int, album: str, track_name: str) -> str:
+        """Get commentary (prefetched or streamed), duck, play FX, restore volume."""
+        # 1️⃣ Commentary from Ollama – wait for the first chunk at full volume
+        chunks: Iterator[str] = iter(())
+        first = None
+        pending = self._pending.pop(idx, None)
+        if pending is not None:
+            try:
+                first = pending.result(timeout=PREFETCH_WAIT_SECS)
+            except Exception:
+                pending.cancel()  # failed or too slow – stream it ourselves
+            if self._stopped.is_set():
+                return ""  # stop() cancelled it – no fallback request
+        if first is None:
+            chunks = self._stream_ollama(album, track_name)
+            first = next(chunks, "")
+        if self._stopped.is_set():
+            return ""  # stopped while waiting on Ollama – no duck, no airhorn
+
+        # 2️⃣ Duck
         self.player.audio_set_volume(self.duck_to)
 
-        # 2️⃣ FX – optional
+        # 3️⃣ FX – optional
         self._play_fx("airhorn")
 
-        # 3️⃣ Commentary from Ollama
-        commentary = self._query_ollama(album, track_name)
+        # 4️⃣ Drain the rest of the stream
+        commentary = (first + "".join(chunks)) or "…"
 
-        # 4️⃣ TTS – Pillow debug only
-        self.tts.render(commentary, pathlib.Path(f"./tmp/{album}-{track_name}.png"))
+        # 5️⃣ TTS – Pillow debug only
+        if self.debug:
+            self.tts.render(commentary, pathlib.Path(f"./tmp/{album}-{track_name}.png"))
 
-        # 5️⃣ Restore music volume
+        # 6️⃣ Restore music volume
         self.player.audio_set_volume(self.music_vol)
 
         return commentary
 
     def _query_ollama(self, album: str, track_name: str) -> str:
-        if ollama is None:
-            return f"[Ollama not available] {album} – {track_name}"
-        prompt = f"DJ‑style commentary on {album} – {track_name}"
+        """Full commentary in one string – prefetch worker; raises on failure."""
+        return "".join(self._ollama_chunks(album, track_name)) or "…"
+
+    def _stream_ollama(self, album: str, track_name: str) -> Iterator[str]:
+        """Like _ollama_chunks(), but a failure becomes the commentary text."""
         try:
-            res = ollama.chat(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                stream=False,
-            )
-            return res.get("message", {}).get("content", "…")
+            yield from self._ollama_chunks(album, track_name)
         except Exception as exc:
-            return f"[Ollama error] {exc}"
+            if ollama is None:
+                yield f"[Ollama not available] {album} – {track_name}"
+            else:
+                yield f"[Ollama error] {exc}"
 
-    def _write_csv(self, commentary: str):
-        """Append a row to the CSV file (create header if empty)."""
-        row = {
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "album": self.queue[self.idx][0],
-            "track": self.queue[self.idx][1].name,
-            "commentary": commentary,
-        }
-        with self.export_csv.open("a", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=row.keys())
-            if f.tell() == 0:
-                writer.writeheader()
-            writer.writerow(row)
+    def _ollama_chunks(self, album: str, track_name: str) -> Iterator[str]:
+        """Yield commentary chunks as Ollama produces them (cached per prompt)."""
+        prompt = f"DJ‑style commentary on {album} – {track_name}"
+        key = hashlib.blake2b(
+            f"{self.model}\n{prompt}".encode(), digest_size=16
+        ).hexdigest()
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+        if ollama is None:
+            raise RuntimeError("Ollama not available")
+        parts = []
+        for part in ollama.chat(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True,
+            keep_alive=OLLAMA_KEEP_ALIVE,
+        ):
+            content = part.get("message", {}).get("content", "")
+            parts.append(content)
+            yield content
+        if any(parts):
+            self._cache_put(key, "".join(parts))
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        with self._db_lock:
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT response FROM commentary WHERE key=?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _cache_put(self, key: str, content: str):
+        with self._db_lock:
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO commentary (key, response, created_at)"
+                " VALUES (?, ?, ?)",
+                (key, content, time.time()),
+            )
+            self._db.commit()
+
+    def _write_csv(self, row: Dict[str, str]):
+        """Append a history row to the already-open CSV file (flushed in batches)."""
+        with self._csv_lock:
+            if self._csv_writer is None:
+                return  # stop() closed it meanwhile
+            self._csv_writer.writerow(row)
+            self._csv_pending += 1
+            if self._csv_pending >= CSV_FLUSH_EVERY:
+                self._csv_fp.flush()
+                self._csv_pending = 0
 
     def _play_fx(self, name: str):
-        """Play a short FX file (e.g. airhorn.wav)."""
-        if not self.fx_dir:
-            return
-        for ext in SUPPORTED_EXT:
-            fx = self.fx_dir / f"{name}{ext}"
-            if fx.is_file():
-                fx_player = vlc.MediaPlayer(str(fx))
-                fx_player.play()
-                break
+        """Play a short FX file (e.g. airhorn.wav) – *name* is case-insensitive."""
+        fx = self._fx_map.get(name.lower())
+        if fx:
+            # Cut off a stinger that is still playing before reusing the player
+            self._fx_player.stop()
+            self._fx_player.set_media(vlc.Media(fx))
+            self._fx_player.play()
 
     # ------------------------------------------------------------------
     # Convenience accessors
     # ------------------------------------------------------------------
+    def current_track_info(self) -> Dict[str, str]:
+        """Album / track of the current play – shared dict, do not mutate."""
+        return self._current_info
+
     def current_track(self) -> tuple:
-        return self.queue[self.idx]
+        return self.albums_arr[self.idx], self.tracks_arr[self.idx]
 
     def current_album(self) -> str:
-        return self.queue[self.idx][0]
+        return self.albums_arr[self.idx]
 
     def current_track_name(self) -> str:
-        return self.queue[self.idx][1].name
+        return self.track_names[self.idx]
 
 
 # ----------------------------------------------------------------------
 # Discover all audio files under a root directory
 # ----------------------------------------------------------------------
-def discover_albums(root: pathlib.Path) -> Dict[str, List[pathlib.Path]]:
+def _walk_audio(directory: str) -> Iterator[str]:
+    """Yield the path of every audio file below *directory* (os.scandir)."""
+    try:
+        it = os.scandir(directory)
+    except OSError:
+        return  # unreadable (.Trashes, .Spotlight-V100, …) – skip, like rglob
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_audio(entry.path)
+            elif entry.name.lower().endswith(SUPPORTED_EXT) and entry.is_file():
+                yield entry.path
+
+
+def _group_by_album(paths) -> Dict[str, List[pathlib.Path]]:
+    """Group audio file paths by the name of their parent directory."""
     albums: Dict[str, List[pathlib.Path]] = {}
-    for path in root.rglob("*"):
-        if path.suffix.lower() in SUPPORTED_EXT:
-            album = path.parent.name
-            albums.setdefault(album, []).append(path)
+    for path in paths:
+        album = os.path.basename(os.path.dirname(path))
+        albums.setdefault(album, []).append(pathlib.Path(path))
+    return albums
+
+
+def _scan_subdir(directory: str) -> Dict[str, List[pathlib.Path]]:
+    return _group_by_album(_walk_audio(directory))
+
+
+def discover_albums(
+    root: pathlib.Path, max_workers: int = DISCOVER_WORKERS
+) -> Dict[str, List[pathlib.Path]]:
+    # Audio files sitting directly in root, plus one scan job per top-level dir
+    top: List[str] = []
+    loose: List[str] = []
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return {}  # missing / unreadable root – caller reports "no audio files"
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                top.append(entry.path)
+            elif entry.name.lower().endswith(SUPPORTED_EXT) and entry.is_file():
+                loose.append(entry.path)
+
+    albums = _group_by_album(loose)
+    # Directory reads are I/O-bound (often a NAS) – scandir drops the GIL
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for found in ex.map(_scan_subdir, top):
+            # Merge, don't update – "CD1" can exist under several artists
+            for album, tracks in found.items():
+                albums.setdefault(album, []).extend(tracks)
+    return albums
+
+
+# ----------------------------------------------------------------------
+# Cached discovery – skip the full walk when the library looks unchanged
+# ----------------------------------------------------------------------
+def _library_fingerprint(root: pathlib.Path) -> str:
+    """blake2b over root's mtime plus the name + mtime of every top-level entry."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{root.resolve()}\0{os.stat(root).st_mtime_ns}\0".encode())
+    with os.scandir(root) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+            h.update(f"{entry.name}\0{mtime}\0".encode())
+    return h.hexdigest()
+
+
+def load_albums(
+    root: pathlib.Path,
+    cache_file: Optional[pathlib.Path] = DEFAULT_LIBRARY_CACHE,
+    rescan: bool = False,
+) -> Dict[str, List[pathlib.Path]]:
+    """
+    discover_albums() behind an on-disk pickle.  The cached result is reused
+    while the fingerprint of *root* matches (one stat per top-level entry);
+    *rescan* forces a fresh walk.
+    """
+    if not cache_file or not root.is_dir():
+        return discover_albums(root)  # nothing to cache / nothing to scan
+    try:
+        digest = _library_fingerprint(root)
+    except OSError:
+        return discover_albums(root)
+    if not rescan:
+        try:
+            with cache_file.open("rb") as f:
+                cached = pickle.load(f)
+            if cached.get("digest") == digest:
+                return cached["albums"]
+        except Exception:
+            pass  # missing / stale / unreadable cache – just rescan
+
+    albums = discover_albums(root)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Per-thread temp name – concurrent scans must not share one file
+        tmp = cache_file.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump({"digest": digest, "albums": albums}, f)
+        tmp.replace(cache_file)
+    except OSError:
+        pass  # caching is best-effort
     return albums
 
 
@@ -291,10 +626,27 @@ def main():
         default=DEFAULT_MUSIC_VOL,
         help="Music playback volume (0‑100)",
     )
+    parser.add_argument(
+        "--cache",
+        type=pathlib.Path,
+        default=DEFAULT_CACHE_DB,
+        help=f"SQLite file caching Ollama commentary (default: {DEFAULT_CACHE_DB})",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Render each commentary to ./tmp/<album>-<track>.png via Pillow",
+    )
+    parser.add_argument(
+        "--rescan",
+        action="store_true",
+        help="Ignore the cached library scan (needed after changes deeper than "
+        "a top-level folder, e.g. root/Artist/Album/new.mp3)",
+    )
     args = parser.parse_args()
 
     print(f"🔍 Scanning {args.root} …")
-    albums = discover_albums(args.root)
+    albums = load_albums(args.root, rescan=args.rescan)
     if not albums:
         print("❌ No audio files found – aborting.")
         sys.exit(1)
@@ -306,6 +658,8 @@ def main():
         fx_dir=args.fx,
         duck_to=args.duck,
         music_vol=args.vol,
+        cache_db=args.cache,
+        debug=args.debug,
     )
     radio.start()
 